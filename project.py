@@ -5,26 +5,118 @@ Adaptive Resource Allocation Simulator — Realistic Multiprogramming
 - Black execution progress bars
 - Fully working Add / Delete / Reset
 - Execution speed boosted ~1.5x
-Requires: psutil
+Requires: psutil, numpy (numba optional; set ARAS_NO_JIT=1 to skip it)
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import os
 import threading
-import time
+import numpy as np
+
+# State codes; Ready/Running (the states holding memory) sort first
+READY, RUNNING, WAITING, COMPLETED = 0, 1, 2, 3
+STATE_NAMES = ("Ready", "Running", "Waiting", "Completed")
+
+# Scheduler state per process, one record per row (see ResourceSchedulerGUI._hot)
+HOT_DTYPE = np.dtype([('pid','i4'), ('cpu','f4'), ('mem','f4'), ('prog','f4'), ('state','i1')], align=True)
+
+# Table cell formatters
+_fmt0 = "{:.0f}".format
+_fmt1 = "{:.1f}".format
+
+# -------------------------
+# Scheduler tick kernels
+# -------------------------
+def _admit(request, eligible, cap):
+    """First-fit admission of integer `request` against `cap`, in queue order."""
+    admitted = np.zeros(len(request), bool)
+    idx = np.flatnonzero(eligible)
+    used = 0
+    while idx.size:
+        if idx.size <= 64:
+            # Short queue: a plain loop beats another round of array calls
+            for i, r in zip(idx.tolist(), request[idx].tolist()):
+                if used + r <= cap:
+                    admitted[i] = True
+                    used += r
+            break
+        # Admit the prefix that fits; the first request past it is refused
+        cum = np.cumsum(request[idx], dtype=np.int32) + used
+        first = np.searchsorted(cum, cap, side="right")
+        admitted[idx[:first]] = True
+        if first == idx.size: break
+        if first: used = int(cum[first-1])
+        # Later, smaller requests may still fit: go again with only those
+        rest = idx[first+1:]
+        idx = rest[request[rest] <= cap - used]
+    return admitted
+
+def _tick_np(cpu_req, mem_req, progress, state, mem_cap=2048.0, scale=0.075):
+    """One scheduler tick on NumPy arrays; updates progress/state in place."""
+    if len(state) <= 128:
+        # Small batches: the plain loop on Python lists beats a dozen array calls
+        cpu, mem, prog, st = cpu_req.tolist(), mem_req.tolist(), progress.tolist(), state.tolist()
+        _tick_py(cpu, mem, prog, st, mem_cap, scale)
+        progress[:] = prog
+        state[:] = st
+        return
+    active = state != COMPLETED
+    # Admit on integer units (1 MB, 0.1 % CPU): int16 requests, int32 prefix sums
+    ready_mask = _admit(np.rint(mem_req).astype(np.int16), active, int(mem_cap))
+    run_mask = _admit(np.rint(cpu_req*10).astype(np.int16), ready_mask, 1000)
+    np.add(progress, cpu_req*scale, out=progress, where=run_mask)
+    np.minimum(progress, 100.0, out=progress)
+    np.copyto(state, WAITING, where=active)
+    np.copyto(state, READY, where=ready_mask)
+    np.copyto(state, RUNNING, where=run_mask)
+    np.copyto(state, COMPLETED, where=run_mask & (progress >= 100.0))
+
+def _tick_py(cpu_req, mem_req, progress, state, mem_cap=2048.0, scale=0.075):
+    """Single-pass loop version of _tick_np, written for Numba to compile."""
+    mem_used = 0.0
+    cpu_alloc = 0.0
+    for i in range(len(cpu_req)):
+        if state[i] == COMPLETED: continue
+        if mem_used + mem_req[i] > mem_cap:
+            state[i] = WAITING
+            continue
+        mem_used += mem_req[i]
+        if cpu_alloc + cpu_req[i] > 100.0:
+            state[i] = READY
+            continue
+        cpu_alloc += cpu_req[i]
+        progress[i] = min(100.0, progress[i] + cpu_req[i]*scale)
+        state[i] = COMPLETED if progress[i] >= 100.0 else RUNNING
+
+# Kernel used by the scheduler; swapped for the compiled one by _load_jit()
+_tick_kernel = _tick_np
+
+def _load_jit():
+    """Compile _tick_py with Numba, if installed, and make it the tick kernel."""
+    global _tick_kernel
+    if os.environ.get("ARAS_NO_JIT") == "1": return
+    try:
+        import numba
+    except ImportError:
+        return
+    # Explicit signature: compiles (or loads from the on-disk cache) right here
+    _tick_kernel = numba.njit("void(f4[:],f4[:],f4[:],i1[:],f4,f4)",
+                              cache=True, fastmath=True)(_tick_py)
 
 # -------------------------
 # Process class
 # -------------------------
 class Process:
+    """Display-side record; progress and state live in ResourceSchedulerGUI._hot."""
     def __init__(self, pid, name, cpu_request, mem_request):
         self.pid = pid
+        self.iid = str(pid)                    # Treeview item id
         self.name = name
         self.cpu_request = float(cpu_request)  # requested CPU %
         self.mem_request = float(mem_request)  # requested memory MB
-        self.progress = 0.0                    # execution completion %
-        self.state = "Ready"                   # Ready / Waiting / Running / Completed
         self.progressbar = None
+        self.pb_value = 0                      # last whole % shown on the progressbar
 
 # -------------------------
 # GUI / Scheduler
@@ -38,12 +130,22 @@ class ResourceSchedulerGUI:
 
         # Data
         self.processes = {}         # pid -> Process
-        self.process_lock = threading.Lock()
         self.next_pid = 1001
         self.next_proc_index = 1
 
+        # Scheduler state: first self._n records of self._hot, in insertion order
+        self._hot = np.zeros(64, HOT_DTYPE)
+        self._n = 0
+        self._last_row = {}         # pid -> last values written to the table
+
+        # Usage totals, refreshed by each scheduler tick
+        self._total_cpu_running = 0.0
+        self._total_mem_active = 0.0
+
         # Control
         self.updating = True
+        self._tick_id = None        # pending scheduler `after` id, None when stopped
+        self._idle_ticks = 0        # consecutive ticks with nothing Running
 
         # Simulated memory limit
         self.total_memory_mb = 2048  # cap to 2048 MB
@@ -59,9 +161,11 @@ class ResourceSchedulerGUI:
         # Build UI
         self.create_ui()
 
-        # Start threads
-        threading.Thread(target=self.scheduler_loop, daemon=True).start()
-        self.update_system_usage()
+        # Compile the tick kernel in the background; NumPy is used until it's ready
+        threading.Thread(target=_load_jit, daemon=True).start()
+
+        # Start the scheduler tick (runs on the Tk event loop, also refreshes usage bars)
+        self._tick_id = self.root.after(450, self._tick)
 
     # -------------------------
     # UI
@@ -109,6 +213,12 @@ class ResourceSchedulerGUI:
         vsb.pack(side="right", fill="y")
         self.tree.configure(yscrollcommand=vsb.set)
         self.tree.pack(side="left", fill="both", expand=True)
+        # Raw Tcl command for per-tick row writes (skips Treeview.item's option handling)
+        self._tk_call = self.root.tk.call
+        self._tree_w = self.tree._w
+        # Row colours: one tag per state, configured once
+        for state, color in {"Waiting":"orange","Ready":"yellow","Running":"green","Completed":"gray"}.items():
+            self.tree.tag_configure(state, background=color)
 
         # Progress bars under table
         tk.Label(self.root, text="Execution Progress Bars", font=("Segoe UI", 9)).pack(padx=12, anchor="w")
@@ -121,6 +231,8 @@ class ResourceSchedulerGUI:
         vsb.config(command=self._shared_scroll)
         self.pb_interior.bind("<Configure>", lambda e: self.pb_canvas.configure(scrollregion=self.pb_canvas.bbox("all")))
         self.pb_canvas.bind("<Configure>", self._on_canvas_configure)
+        # Spare (unpacked) progressbars, reused across add/delete/reset
+        self._pb_pool = [self._new_progressbar() for _ in range(64)]
 
         # Bottom controls
         bottom_frame = tk.Frame(self.root, relief="groove", bd=1)
@@ -184,20 +296,32 @@ class ResourceSchedulerGUI:
         if not name: messagebox.showwarning("Validation", "Process name cannot be empty."); return
         cpu_req = float(self.cpu_slider.get())
         mem_req = float(self.mem_slider.get())
-        with self.process_lock:
-            pid = self.next_pid
-            self.next_pid += 1
-            proc = Process(pid, name, cpu_req, mem_req)
-            self.processes[pid] = proc
-            iid = str(pid)
-            self.tree.insert("", "end", iid=iid,
-                             values=(pid,name,f"{cpu_req:.1f}",f"0.0",f"{mem_req:.0f}",f"0.0",f"0.0",proc.state))
-            pb = ttk.Progressbar(self.pb_interior, length=900, maximum=100, style="black.Horizontal.TProgressbar")
-            pb.pack(pady=3, anchor="w", fill="x")
-            proc.progressbar = pb
-            self.next_proc_index += 1
-            self.name_var.set(f"Process_{self.next_proc_index}")
-            self._adjust_pb_canvas_height()
+        pid = self.next_pid
+        self.next_pid += 1
+        proc = Process(pid, name, cpu_req, mem_req)
+        self.processes[pid] = proc
+        if self._n == len(self._hot):
+            self._hot = np.concatenate([self._hot, np.zeros(len(self._hot), HOT_DTYPE)])
+        self._hot[self._n] = (pid, cpu_req, mem_req, 0.0, READY)
+        self._n += 1
+        self.tree.insert("", "end", iid=proc.iid,
+                         values=(pid,name,f"{cpu_req:.1f}",f"0.0",f"{mem_req:.0f}",f"0.0",f"0.0",STATE_NAMES[READY]),
+                         tags=(STATE_NAMES[READY],))
+        pb = self._pb_pool.pop() if self._pb_pool else self._new_progressbar()
+        pb['value'] = 0
+        pb.pack(pady=3, anchor="w", fill="x")
+        proc.progressbar = pb
+        self.next_proc_index += 1
+        self.name_var.set(f"Process_{self.next_proc_index}")
+        self._adjust_pb_canvas_height()
+        self._wake()
+
+    def _new_progressbar(self):
+        return ttk.Progressbar(self.pb_interior, length=900, maximum=100, style="black.Horizontal.TProgressbar")
+
+    def _release_progressbar(self, pb):
+        pb.pack_forget()
+        self._pb_pool.append(pb)
 
     def _adjust_pb_canvas_height(self):
         count = len(self.processes)
@@ -212,103 +336,108 @@ class ResourceSchedulerGUI:
         selected = self.tree.selection()
         if not selected: messagebox.showwarning("No Selection", "Select a process to delete."); return
         iid = selected[0]
-        pid = int(self.tree.item(iid,"values")[0])
-        with self.process_lock: proc = self.processes.pop(pid,None)
-        if proc and proc.progressbar: proc.progressbar.destroy()
+        pid = int(iid)
+        proc = self.processes.pop(pid,None)
+        hot = self._hot[:self._n]
+        kept = hot[hot['pid'] != pid]
+        self._n = len(kept)
+        self._hot[:self._n] = kept
+        self._last_row.pop(pid, None)
+        if proc and proc.progressbar: self._release_progressbar(proc.progressbar)
         self.tree.delete(iid)
+        self._wake()
 
     # -------------------------
     # Reset
     # -------------------------
     def reset_all(self):
         if not messagebox.askyesno("Confirm Reset","This will clear all processes. Continue?"): return
-        with self.process_lock:
-            self.processes.clear()
+        for p in self.processes.values():
+            if p.progressbar: self._release_progressbar(p.progressbar)
+        self.processes.clear()
+        self._n = 0
+        self._last_row.clear()
         for iid in self.tree.get_children(): self.tree.delete(iid)
-        for child in self.pb_interior.winfo_children(): child.destroy()
         self.next_pid = 1001
         self.next_proc_index = 1
         self.name_var.set(f"Process_{self.next_proc_index}")
         self._adjust_pb_canvas_height()
+        self._wake()
 
     # -------------------------
-    # Scheduler loop
+    # Scheduler tick
     # -------------------------
-    def scheduler_loop(self):
-        while True:
-            with self.process_lock:
-                procs = list(self.processes.values())
-
-            available_cpu = 100.0
-            mem_used = 0.0
-            ready_queue = []
-
-            # Determine states based on memory
-            for p in procs:
-                if p.state == "Completed": continue
-                if mem_used + p.mem_request > self.total_memory_mb:
-                    p.state = "Waiting"
-                else:
-                    p.state = "Ready"
-                    ready_queue.append(p)
-                    mem_used += p.mem_request
-
-            # Allocate CPU to Ready processes (respect 100% CPU cap)
-            running_procs = []
-            cpu_allocated = 0.0
-            for p in ready_queue:
-                if cpu_allocated + p.cpu_request <= 100.0:
-                    p.state = "Running"
-                    running_procs.append((p, p.cpu_request))
-                    cpu_allocated += p.cpu_request
-                else:
-                    p.state = "Ready"
-
-            # Update progress (boosted 1.5x)
-            scale = 0.05*1.5
-            for p, cpu_alloc in running_procs:
-                p.progress = min(100.0, p.progress + cpu_alloc*scale)
-                if p.progress >= 100.0:
-                    p.state = "Completed"
-
-            # Update table rows
-            for p in procs:
-                mem_display = p.mem_request if p.state in ["Ready","Running"] else 0.0
-                alloc_cpu = next((cpu for proc,cpu in running_procs if proc==p),0.0)
-                self.root.after(0, self.update_process_row, p, alloc_cpu, mem_display)
-
-            time.sleep(0.45)
-
-    def update_process_row(self,proc,allocated_cpu,mem_used):
-        if self.tree.exists(str(proc.pid)):
-            self.tree.item(str(proc.pid), values=(
-                proc.pid,
-                proc.name,
-                f"{proc.cpu_request:.1f}",
-                f"{allocated_cpu:.1f}",
-                f"{proc.mem_request:.0f}",
-                f"{mem_used:.0f}",
-                f"{proc.progress:.1f}",
-                proc.state
-            ))
-            if proc.progressbar: proc.progressbar['value'] = proc.progress
-            color = {"Waiting":"orange","Ready":"yellow","Running":"green","Completed":"gray"}.get(proc.state,"white")
-            self.tree.tag_configure(str(proc.pid), background=color)
-            self.tree.item(str(proc.pid), tags=(str(proc.pid),))
+    def _tick(self):
+        if not self._n:
+            # Nothing to schedule: zero the usage bars once, then wait for add_process
+            self._tick_id = None
+            if self._total_cpu_running or self._total_mem_active:
+                self._total_cpu_running = self._total_mem_active = 0.0
+                self.update_system_usage()
+            return
+
+        hot = self._hot[:self._n]
+        cpu_req, mem_req, progress, state = hot['cpu'], hot['mem'], hot['prog'], hot['state']
+
+        # Memory admission, CPU cap and progress (boosted 1.5x)
+        was_active = state != COMPLETED
+        _tick_kernel(cpu_req, mem_req, progress, state, float(self.total_memory_mb), 0.05*1.5)
+        run_mask = (state == RUNNING) | (was_active & (state == COMPLETED))
+        active_mask = state <= RUNNING
+        self._total_cpu_running = float(cpu_req[state == RUNNING].sum())
+        self._total_mem_active = float(mem_req[active_mask].sum())
+        self.update_system_usage()
+
+        # Update table rows in one batch
+        snap = zip(hot['pid'].tolist(), np.where(run_mask, cpu_req, 0.0).tolist(),
+                   np.where(active_mask, mem_req, 0.0).tolist(), progress.tolist(), state.tolist())
+        self._apply_snapshot(snap)
+
+        # Back off while nothing is Running; stop once everything has
+        # completed (add/delete/reset wake the scheduler again)
+        self._tick_id = None
+        self._idle_ticks = 0 if run_mask.any() else self._idle_ticks + 1
+        if not self.updating or (state == COMPLETED).all(): return
+        self._tick_id = self.root.after(min(2000, 450 << min(self._idle_ticks, 3)), self._tick)
+
+    def _wake(self):
+        if self._tick_id is not None and self._idle_ticks == 0: return   # already ticking at full rate
+        if self._tick_id is not None: self.root.after_cancel(self._tick_id)
+        self._idle_ticks = 0
+        self._tick_id = self.root.after(1, self._tick)
+
+    def _apply_snapshot(self, snap):
+        # Tk defers widget redisplay to an idle handler, so all row writes in
+        # this batch are painted in one pass. Don't call update_idletasks()
+        # here, and don't detach/reattach rows (that loses selection/scroll).
+        for pid, allocated_cpu, mem_used, progress, state in snap:
+            proc = self.processes.get(pid)
+            if proc is not None: self.update_process_row(proc, allocated_cpu, mem_used, progress, state)
+
+    def update_process_row(self,proc,allocated_cpu,mem_used,progress,state):
+        row = (proc.pid, proc.name, _fmt1(proc.cpu_request), _fmt1(allocated_cpu),
+               _fmt0(proc.mem_request), _fmt0(mem_used), _fmt1(progress), STATE_NAMES[state])
+        if row == self._last_row.get(proc.pid): return
+        try: self._tk_call(self._tree_w, "item", proc.iid, "-values", row, "-tags", row[-1])
+        except tk.TclError: return
+        self._last_row[proc.pid] = row
+        # Sub-percent moves aren't visible on the bar; only send whole steps
+        pb_value = int(progress)
+        if proc.progressbar and pb_value != proc.pb_value:
+            proc.progressbar['value'] = pb_value
+            proc.pb_value = pb_value
 
     # -------------------------
     # System usage
     # -------------------------
     def update_system_usage(self):
-        with self.process_lock:
-            total_cpu = sum(p.cpu_request for p in self.processes.values() if p.state=="Running")
-            total_mem = sum(p.mem_request for p in self.processes.values() if p.state in ["Ready","Running"])
+        total_cpu = self._total_cpu_running
+        total_mem = self._total_mem_active
         self.cpu_bar['value'] = min(100.0,total_cpu)
         self.cpu_percent_label.config(text=f"{min(100.0,total_cpu):.1f} %")
         mem_percent = min(100.0,(total_mem/self.total_memory_mb)*100.0)
         self.mem_bar['value'] = mem_percent
         self.mem_percent_label.config(text=f"{mem_percent:.1f} %")
-        if self.updating: self.root.after(500,self.update_system_usage)
 
     # -------------------------
     # Stop
@@ -0,0 +1,77 @@
+import importlib.util
+import random
+import unittest
+
+import numpy as np
+
+import project
+from project import _tick_np, _tick_py, HOT_DTYPE, READY, RUNNING, WAITING, COMPLETED
+
+
+def _tick_reference(procs, mem_cap=2048.0, scale=0.075):
+    """The original scheduler_loop passes, on [cpu, mem, progress, state] lists."""
+    mem_used = 0.0
+    ready_queue = []
+    for p in procs:
+        if p[3] == COMPLETED: continue
+        if mem_used + p[1] > mem_cap:
+            p[3] = WAITING
+        else:
+            p[3] = READY
+            ready_queue.append(p)
+            mem_used += p[1]
+    cpu_allocated = 0.0
+    running = []
+    for p in ready_queue:
+        if cpu_allocated + p[0] <= 100.0:
+            p[3] = RUNNING
+            running.append(p)
+            cpu_allocated += p[0]
+    for p in running:
+        p[2] = min(100.0, p[2] + p[0]*scale)
+        if p[2] >= 100.0: p[3] = COMPLETED
+
+
+class TickKernelTest(unittest.TestCase):
+    def test_kernels_match_reference(self):
+        rng = random.Random(1234)
+        # Sizes on both sides of _tick_np's small-batch cutoff
+        for n in (0, 1, 5, 40, 150, 300):
+            for _ in range(5):
+                procs = [[float(rng.randint(1, 100)), float(rng.randint(0, 900)), 0.0, 0] for _ in range(n)]
+                cpu = np.array([p[0] for p in procs], np.float32)
+                mem = np.array([p[1] for p in procs], np.float32)
+                arrays = {kernel: (np.zeros(n, np.float32), np.zeros(n, np.int8)) for kernel in (_tick_np, _tick_py)}
+                for _ in range(60):
+                    _tick_reference(procs)
+                    for kernel, (progress, state) in arrays.items():
+                        kernel(cpu, mem, progress, state, 2048.0, 0.075)
+                        self.assertEqual(state.tolist(), [p[3] for p in procs], kernel.__name__)
+                        np.testing.assert_allclose(progress, [p[2] for p in procs], atol=1e-3)
+
+    def _check_hot_views(self, kernel):
+        # _tick passes strided field views of the HOT_DTYPE records, not separate arrays
+        rng = random.Random(4321)
+        for n in (1, 50, 200, 1000):
+            procs = [[float(rng.randint(1, 100)), float(rng.randint(0, 900)), 0.0, 0] for _ in range(n)]
+            hot = np.zeros(n, HOT_DTYPE)
+            hot['cpu'] = [p[0] for p in procs]
+            hot['mem'] = [p[1] for p in procs]
+            for _ in range(400):
+                _tick_reference(procs)
+                kernel(hot['cpu'], hot['mem'], hot['prog'], hot['state'], 2048.0, 0.075)
+                self.assertEqual(hot['state'].tolist(), [p[3] for p in procs])
+                np.testing.assert_allclose(hot['prog'], [p[2] for p in procs], atol=1e-3)
+
+    def test_numpy_kernel_on_hot_views(self):
+        self._check_hot_views(_tick_np)
+
+    @unittest.skipUnless(importlib.util.find_spec("numba"), "numba not installed")
+    def test_numba_kernel_on_hot_views(self):
+        project._load_jit()
+        if project._tick_kernel is _tick_np: self.skipTest("JIT disabled via ARAS_NO_JIT")
+        self._check_hot_views(project._tick_kernel)
+
+
+if __name__ == "__main__":
+    unittest.main()